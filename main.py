@@ -3,14 +3,23 @@
 career_advisor.py
 A single-file CLI "AI" Career Advisor: maps skills, recommends roles, builds
 a 12-week roadmap, simulates mock interviews, and can save/load profiles.
-Standard-library only.
+Standard-library only (uses orjson for profile files when installed).
 """
 
-import json
 import random
-import textwrap
+import sys
 import os
-from datetime import datetime
+from collections.abc import Callable, Set as AbstractSet
+from functools import lru_cache
+
+# json/orjson, textwrap and datetime are imported where first used, to keep
+# CLI startup short.
+
+# Local stand-in for typing.TYPE_CHECKING, so the _WRAPPERS annotation can
+# name textwrap without importing typing; type checkers treat it as True.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    import textwrap
 
 # ---------- Role database ----------
 # Each role has: required skills (keywords), a short description, trending tags
@@ -65,9 +74,46 @@ TRENDING_BOOST_TAGS = {
     "data": 0.05,
     "web": 0.03
 }
+TRENDING_AREAS = {"ai", "ml", "cloud", "data"}
+
+# Freeze skill/tag lists and intern their strings so set lookups against
+# (also interned) user tokens can short-circuit on identity
+for _r in ROLES.values():
+    _r["skills"] = tuple(sys.intern(s) for s in _r["skills"])
+    _r["tags"] = tuple(sys.intern(t) for t in _r["tags"])
+del _r
+
+# Per-role lookups derived once from ROLES (constant at runtime)
+ROLES_SKILLSETS = {k: frozenset(v["skills"]) for k, v in ROLES.items()}
+# Skill sets packed as int bitmasks (one bit per vocabulary skill), so
+# overlap is a single AND + popcount
+SKILL_VOCAB = {skill: i for i, skill in enumerate(sorted({s for r in ROLES.values() for s in r["skills"]}))}
+# Parallel per-role arrays (index i describes ROLE_NAMES[i]) for the scoring loop
+ROLE_NAMES = tuple(ROLES)
+ROLE_MASKS = tuple(sum(1 << SKILL_VOCAB[s] for s in ROLES_SKILLSETS[k]) for k in ROLE_NAMES)
+ROLE_REQ_COUNTS = tuple(m.bit_count() for m in ROLE_MASKS)
+# boosts kept per tag (not pre-summed) so they are added in the same order as before
+ROLE_TAGBOOSTS = tuple(tuple(TRENDING_BOOST_TAGS.get(t, 0) for t in ROLES[k]["tags"]) for k in ROLE_NAMES)
+ROLE_TRENDFLAG = tuple(any(t in TRENDING_AREAS for t in ROLES[k]["tags"]) for k in ROLE_NAMES)
 
 # ---------- Interview question bank ----------
-INTERVIEW_QUESTIONS = {
+class Question:
+    """An interview question and the keywords a good answer should mention."""
+    __slots__ = ("text", "keywords")
+    text: str
+    keywords: frozenset[str]
+
+    def __init__(self, text: str, keywords: frozenset[str]) -> None:
+        object.__setattr__(self, "text", text)
+        object.__setattr__(self, "keywords", keywords)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f"Question is read-only; cannot set {name!r}")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"Question is read-only; cannot delete {name!r}")
+
+_QUESTION_BANK = {
     "Frontend Engineer": [
         ("Explain the virtual DOM and why React uses it.", ["react", "virtual", "dom", "diff", "reconciliation"]),
         ("How do you optimize web performance?", ["lazy", "bundle", "cdn", "cache", "minify", "critical"])
@@ -89,112 +135,134 @@ INTERVIEW_QUESTIONS = {
         ("How do you keep your skills up to date?", ["learn", "courses", "projects", "reading", "practice"])
     ]
 }
+INTERVIEW_QUESTIONS: dict[str, tuple[Question, ...]] = {
+    role: tuple(Question(q, frozenset(kws)) for q, kws in qs)
+    for role, qs in _QUESTION_BANK.items()
+}
+
+# (role, question) -> keywords; unknown pairs fall back to the first Default question
+_Q2KW = {(role, q.text): q.keywords for role, qs in INTERVIEW_QUESTIONS.items() for q in qs}
+_DEFAULT_KW = INTERVIEW_QUESTIONS["Default"][0].keywords
 
 # ---------- Helper utilities ----------
-def normalize(skill_str):
+def normalize(skill_str: str) -> str:
     """Normalize a skill string: lower and strip punctuation-ish characters."""
     return skill_str.strip().lower()
 
-def tokenize_skills(skills_list):
+# "_" and "-" are treated as word separators in skill names
+_SKILL_TRANS = str.maketrans({"_": " ", "-": " "})
+
+def tokenize_skills(skills_list: list[str]) -> set[str]:
     """Return normalized set of skills from user input list."""
     out = set()
     for s in skills_list:
         if not s:
             continue
-        s = s.replace("_", " ").replace("-", " ")
-        tokens = [t.strip() for t in s.split(",")] if "," in s else [s]
-        for tok in tokens:
+        for tok in s.translate(_SKILL_TRANS).split(","):
             tok = normalize(tok)
             if tok:
-                out.add(tok)
+                out.add(sys.intern(tok))
     return out
 
-def score_role(user_skills_set, role_key):
-    role = ROLES[role_key]
-    req = set(role["skills"])
-    # base overlap ratio
-    overlap = len(user_skills_set & req)
-    ratio = overlap / max(1, len(req))
-    # raw base score 0..1
-    score = 0.6 * ratio + 0.2 * min(0.5, overlap / max(1, len(user_skills_set)))  # preference for overlap
-    # trending boost
-    for tag in role.get("tags", []):
-        score += TRENDING_BOOST_TAGS.get(tag, 0)
-    # clamp
-    score = max(0.0, min(1.0, score))
-    # reason
-    reason_parts = []
-    if overlap > 0:
-        reason_parts.append(f"{overlap} matching skill(s)")
-    else:
-        reason_parts.append("No direct skill matches")
-    if any(t in ["ai","ml","cloud","data"] for t in role.get("tags", [])):
-        reason_parts.append("Role aligned with trending areas")
-    return score, "; ".join(reason_parts)
+def skills_mask(skills_set: AbstractSet[str]) -> int:
+    """Pack a tokenized skill set into a SKILL_VOCAB bitmask (unknown skills are dropped)."""
+    mask = 0
+    for tok in skills_set:
+        i = SKILL_VOCAB.get(tok)
+        if i is not None:
+            mask |= 1 << i
+    return mask
 
-def top_role_recommendations(user_skills, top_n=4):
-    user_skills_set = tokenize_skills(user_skills)
+def _score_all(user_mask: int, n_user: int) -> list[tuple[str, float, str]]:
+    """(role, score, reason) for every role, in ROLE_NAMES order."""
+    n_user = max(1, n_user)
     scored = []
-    for role in ROLES:
-        score, reason = score_role(user_skills_set, role)
+    for role, role_mask, req, boosts, trending in zip(
+            ROLE_NAMES, ROLE_MASKS, ROLE_REQ_COUNTS, ROLE_TAGBOOSTS, ROLE_TRENDFLAG):
+        overlap = (user_mask & role_mask).bit_count()
+        # base overlap ratio and preference for overlap
+        score = 0.6 * (overlap / max(1, req)) + 0.2 * min(0.5, overlap / n_user)
+        # trending boost
+        for b in boosts:
+            score += b
+        # clamp
+        score = max(0.0, min(1.0, score))
+        reason = f"{overlap} matching skill(s)" if overlap > 0 else "No direct skill matches"
+        if trending:
+            reason += "; Role aligned with trending areas"
         scored.append((role, score, reason))
+    return scored
+
+def top_role_recommendations(user_skills, top_n=4):
+    return top_role_recommendations_set(tokenize_skills(user_skills), top_n)
+
+def top_role_recommendations_set(user_skills_set, top_n=4):
+    """Like top_role_recommendations, for an already-tokenized skill set."""
+    return list(_ranked_cached(frozenset(user_skills_set))[:top_n])
+
+def _rank(skills_set):
+    """All roles as (role, score, reason), best first."""
+    scored = _score_all(skills_mask(skills_set), len(skills_set))
     scored.sort(key=lambda x: x[1], reverse=True)
-    return scored[:top_n]
+    return scored
+
+@lru_cache(maxsize=32)
+def _ranked_cached(skills_fs):
+    """Full role ranking for a skill set; callers slice it to their top_n."""
+    # safe to memoize: ROLES is constant at runtime
+    return tuple(_rank(skills_fs))
 
-def skill_gap_for_role(user_skills_set, role_key):
-    req = set(ROLES[role_key]["skills"])
-    missing = sorted(list(req - user_skills_set))
-    present = sorted(list(req & user_skills_set))
+def top_role_recommendations_batch(skills_lists, top_n=4):
+    """Recommendations for many users at once (e.g. bulk resume scoring)."""
+    return [_rank(tokenize_skills(skills))[:top_n] for skills in skills_lists]
+
+def skill_gap_for_role(user_skills_set: AbstractSet[str], role_key: str) -> tuple[list[str], list[str]]:
+    req = ROLES_SKILLSETS[role_key]
+    missing = sorted(req - user_skills_set)
+    present = sorted(req & user_skills_set)
     return present, missing
 
 # ---------- Roadmap builder ----------
-def build_12_week_roadmap(chosen_role, user_skills):
-    user_set = tokenize_skills(user_skills)
+_LEARN_TMPL = "Learn fundamentals of **{}** (3-6 hrs) — small exercises & mini-tutorial."
+_DEEPEN_TEXT = "Deepen core fundamentals and practice small exercises (4-6 hrs)."
+# Weeks 6-12 do not depend on the role or the user's skills
+_STATIC_WEEKS = (
+    ("Week 6", "Continue project; add tests, version control and CI steps."),
+    ("Week 7", "Add deployment / demo (host on free tier) and write README."),
+    ("Week 8", "Polish UI/UX and fix performance issues; get feedback."),
+    # Weeks 9-10 interview and DS practice
+    ("Week 9", "Practice mock interviews: behavioral + 5 coding problems (2-3 hrs/day)."),
+    ("Week 10", "Data structures and algorithms: targeted practice (arrays, maps, recursion)."),
+    # Weeks 11-12 apply & network
+    ("Week 11", "Prepare tailored resume and LinkedIn; publish project demo (portfolio)."),
+    ("Week 12", "Apply to roles, network, and schedule mock interviews with peers/mentors."),
+)
+
+def build_12_week_roadmap(chosen_role: str, user_skills: list[str]) -> tuple[list[tuple[str, str]], list[str], list[str]]:
+    return build_12_week_roadmap_set(chosen_role, tokenize_skills(user_skills))
+
+def build_12_week_roadmap_set(chosen_role: str, user_set: AbstractSet[str]) -> tuple[list[tuple[str, str]], list[str], list[str]]:
+    """Like build_12_week_roadmap, for an already-tokenized skill set."""
     present, missing = skill_gap_for_role(user_set, chosen_role)
-    roadmap = []
     # Strategy:
     # - Weeks 1-4: fundamentals + address top-missing (1 per week)
     # - Weeks 5-8: build project(s) integrating missing + CI/CD / infra basics
     # - Weeks 9-10: interview prep & DS
     # - Weeks 11-12: portfolio + apply
     missing_top = missing[:4]  # up to 4 important gaps
-    week = 1
     # Weeks 1-4
-    for i in range(4):
-        if i < len(missing_top):
-            task = f"Learn fundamentals of **{missing_top[i]}** (3-6 hrs) — small exercises & mini-tutorial."
-        else:
-            task = "Deepen core fundamentals and practice small exercises (4-6 hrs)."
-        roadmap.append((f"Week {week}", task)); week += 1
+    roadmap = [
+        (f"Week {i + 1}", _LEARN_TMPL.format(missing_top[i]) if i < len(missing_top) else _DEEPEN_TEXT)
+        for i in range(4)
+    ]
     # Weeks 5-8 project-focused
-    roadmap.append((f"Week {week}", f"Start a guided project for {chosen_role}, include at least one missing skill."))
-    week += 1
-    roadmap.append((f"Week {week}", "Continue project; add tests, version control and CI steps.")); week += 1
-    roadmap.append((f"Week {week}", "Add deployment / demo (host on free tier) and write README.")); week += 1
-    roadmap.append((f"Week {week}", "Polish UI/UX and fix performance issues; get feedback.")); week += 1
-    # Weeks 9-10 interview and DS practice
-    roadmap.append((f"Week {week}", "Practice mock interviews: behavioral + 5 coding problems (2-3 hrs/day).")); week += 1
-    roadmap.append((f"Week {week}", "Data structures and algorithms: targeted practice (arrays, maps, recursion).")); week += 1
-    # Weeks 11-12 apply & network
-    roadmap.append((f"Week {week}", "Prepare tailored resume and LinkedIn; publish project demo (portfolio).")); week += 1
-    roadmap.append((f"Week {week}", "Apply to roles, network, and schedule mock interviews with peers/mentors."))
+    roadmap.append(("Week 5", f"Start a guided project for {chosen_role}, include at least one missing skill."))
+    roadmap.extend(_STATIC_WEEKS)
     return roadmap, present, missing
 
 # ---------- Mock interview evaluator ----------
-def evaluate_mock_answer(role, question, answer_text):
-    answer = answer_text.lower()
-    # baseline random fluency/clarity factor
-    fluency = random.uniform(0.7, 0.95)
-    keywords = []
-    if role in INTERVIEW_QUESTIONS:
-        # try to find matching keywords for the specific question
-        for q, kws in INTERVIEW_QUESTIONS[role]:
-            if q == question:
-                keywords = kws
-                break
-    else:
-        # fallback
-        keywords = INTERVIEW_QUESTIONS["Default"][0][1]
+def _grade_answer(keywords: frozenset[str], answer: str, fluency: float) -> tuple[int, str]:
+    """Score a lowercased answer and build its feedback text."""
     key_matches = sum(1 for kw in keywords if kw in answer)
     # score composition
     score = int(40 + (key_matches * 12) + (fluency * 40))
@@ -215,24 +283,81 @@ def evaluate_mock_answer(role, question, answer_text):
         feedback.append("Work on structure: start with a one-sentence summary, then steps, then trade-offs.")
     return score, " ".join(feedback)
 
+def evaluate_mock_answer(role: str, question: str, answer_text: str) -> tuple[int, str]:
+    answer = answer_text.lower()
+    # baseline random fluency/clarity factor
+    fluency = random.uniform(0.7, 0.95)
+    return _grade_answer(_Q2KW.get((role, question), _DEFAULT_KW), answer, fluency)
+
+_rng_local = None  # threading.local(), created on first batch call
+
+def _thread_rng():
+    """Per-thread Random instance, so concurrent graders don't share the global one.
+
+    Each thread's instance is seeded from the global RNG the first time that
+    thread grades a batch, so random.seed() beforehand makes it reproducible.
+    """
+    global _rng_local
+    if _rng_local is None:
+        import threading
+        _rng_local = threading.local()
+    rng = getattr(_rng_local, "rng", None)
+    if rng is None:
+        rng = _rng_local.rng = random.Random(random.getrandbits(64))
+    return rng
+
+def evaluate_mock_answers_batch(role, question, answers):
+    """Grade many answers to one question; returns a list of (score, feedback)."""
+    keywords = _Q2KW.get((role, question), _DEFAULT_KW)
+    uniform = _thread_rng().uniform
+    return [_grade_answer(keywords, a.lower(), uniform(0.7, 0.95)) for a in answers]
+
 # ---------- Persistence ----------
+_JsonCodec = tuple[Callable[[object], bytes], Callable[[bytes], object]]
+_json_codec: _JsonCodec | None = None
+
+def _get_json_codec() -> _JsonCodec:
+    """Return (dumps, loads) for profile files: orjson if installed, else stdlib json."""
+    global _json_codec
+    if _json_codec is None:
+        try:
+            import orjson
+            _json_codec = (lambda o: orjson.dumps(o, option=orjson.OPT_INDENT_2), orjson.loads)
+        except ImportError:
+            import json
+            _json_codec = (lambda o: json.dumps(o, indent=2).encode("utf-8"), json.loads)
+    return _json_codec
+
 def save_profile(path, profile):
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(profile, f, indent=2)
+    # keys starting with "_" are runtime caches, not part of the saved profile
+    data = {k: v for k, v in profile.items() if not k.startswith("_")}
+    with open(path, "wb") as f:
+        f.write(_get_json_codec()[0](data))
     return path
 
 def load_profile(path):
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    with open(path, "rb") as f:
+        return _get_json_codec()[1](f.read())
 
 # ---------- CLI helpers ----------
+_WRAPPERS: "dict[int, textwrap.TextWrapper]" = {}  # indent -> TextWrapper, reused across calls
+
 def wrap(s, indent=0):
-    return textwrap.fill(s, width=78, subsequent_indent=" " * indent)
+    w = _WRAPPERS.get(indent)
+    if w is None:
+        import textwrap
+        w = _WRAPPERS[indent] = textwrap.TextWrapper(width=78, subsequent_indent=" " * indent)
+    return w.fill(s)
+
+def header_lines(title):
+    return ["\n" + "=" * 78, title, "=" * 78 + "\n"]
 
 def print_header(title):
-    print("\n" + "=" * 78)
-    print(title)
-    print("=" * 78 + "\n")
+    print_lines(header_lines(title))
+
+def print_lines(lines):
+    """Write several lines to stdout with a single write call."""
+    sys.stdout.write("\n".join(lines) + "\n")
 
 def input_skills_prompt():
     print("Enter comma-separated skills (e.g., 'Python, React, SQL'):")
@@ -243,51 +368,59 @@ def input_skills_prompt():
     parts = [p.strip() for p in raw.replace(";", ",").split(",") if p.strip()]
     return parts
 
+MAIN_MENU = """
+Main Menu — choose an action:
+  1) Show role recommendations
+  2) View personalized 12-week roadmap
+  3) Mock interview simulator
+  4) Skill-gap analysis for a role
+  5) Save profile
+  6) Load profile
+  7) Quick tips for 'evolving job market'
+  0) Exit
+"""
+
 def main_menu():
     print_header("Hack.Vision — CLI AI Career Advisor (Prototype)")
     name = input("What's your name? (press Enter for 'Student'): ").strip() or "Student"
     print(f"Welcome, {name} 👋")
     user_skills = input_skills_prompt()
+    from datetime import datetime, timezone
     profile = {
         "name": name,
         "skills": user_skills,
-        "created_at": datetime.utcnow().isoformat() + "Z"
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds")
     }
+    profile["_skills_set"] = frozenset(tokenize_skills(user_skills))
 
     while True:
-        print("\nMain Menu — choose an action:")
-        print("  1) Show role recommendations")
-        print("  2) View personalized 12-week roadmap")
-        print("  3) Mock interview simulator")
-        print("  4) Skill-gap analysis for a role")
-        print("  5) Save profile")
-        print("  6) Load profile")
-        print("  7) Quick tips for 'evolving job market'")
-        print("  0) Exit")
+        sys.stdout.write(MAIN_MENU)
         choice = input("Choice: ").strip()
         if choice == "1":
-            recs = top_role_recommendations(profile["skills"], top_n=6)
-            print_header("Role Recommendations")
+            recs = top_role_recommendations_set(profile["_skills_set"], top_n=6)
+            buf = header_lines("Role Recommendations")
             for role, score, reason in recs:
-                print(f"- {role:22} | Score: {int(score*100)}% | {reason}")
+                buf.append(f"- {role:22} | Score: {int(score*100)}% | {reason}")
             # choose top
             if recs:
                 top_role = recs[0][0]
-                print(f"\nTop suggestion: {top_role} — {ROLES[top_role]['desc']}")
+                buf.append(f"\nTop suggestion: {top_role} — {ROLES[top_role]['desc']}")
+            print_lines(buf)
         elif choice == "2":
-            recs = top_role_recommendations(profile["skills"], top_n=1)
+            recs = top_role_recommendations_set(profile["_skills_set"], top_n=1)
             if not recs:
                 print("No recommendations yet — add skills first.")
                 continue
             chosen_role = recs[0][0]
-            roadmap, present, missing = build_12_week_roadmap(chosen_role, profile["skills"])
-            print_header(f"12-Week Roadmap — Target: {chosen_role}")
-            print(f"Detected skills relevant to role: {', '.join(present) if present else 'None'}")
-            print(f"Top missing skills to focus on: {', '.join(missing[:6]) if missing else 'None'}\n")
+            roadmap, present, missing = build_12_week_roadmap_set(chosen_role, profile["_skills_set"])
+            buf = header_lines(f"12-Week Roadmap — Target: {chosen_role}")
+            buf.append(f"Detected skills relevant to role: {', '.join(present) if present else 'None'}")
+            buf.append(f"Top missing skills to focus on: {', '.join(missing[:6]) if missing else 'None'}\n")
             for w, t in roadmap:
-                print(f"{w:8} - {t}")
+                buf.append(f"{w:8} - {t}")
+            print_lines(buf)
         elif choice == "3":
-            recs = top_role_recommendations(profile["skills"], top_n=3)
+            recs = top_role_recommendations_set(profile["_skills_set"], top_n=3)
             if not recs:
                 print("Add skills first to generate interview questions.")
                 continue
@@ -306,8 +439,7 @@ def main_menu():
                     role = recs[0][0]
             # choose question
             banks = INTERVIEW_QUESTIONS.get(role, INTERVIEW_QUESTIONS.get("Default"))
-            q_idx = random.randrange(len(banks))
-            question, _ = banks[q_idx]
+            question = random.choice(banks).text
             print_header(f"Mock Interview — Role: {role}")
             print("Question:")
             print(wrap(question, indent=4))
@@ -328,7 +460,7 @@ def main_menu():
             except Exception:
                 print("Invalid choice.")
                 continue
-            present, missing = skill_gap_for_role(tokenize_skills(profile["skills"]), role)
+            present, missing = skill_gap_for_role(profile["_skills_set"], role)
             print_header(f"Skill-gap Analysis for: {role}")
             print("Required skills for role:", ", ".join(ROLES[role]["skills"]))
             print("You have:", ", ".join(present) if present else "None")
@@ -344,9 +476,10 @@ def main_menu():
             else:
                 loaded = load_profile(filename)
                 profile = loaded
+                profile["_skills_set"] = frozenset(tokenize_skills(profile.get("skills", [])))
                 print(f"Loaded profile for {profile.get('name','(unknown)')}, skills: {', '.join(profile.get('skills',[]))}")
         elif choice == "7":
-            print_header("Quick Tips — Evolving Job Market")
+            buf = header_lines("Quick Tips — Evolving Job Market")
             tips = [
                 "1) Learn one cloud platform (AWS/GCP/Azure) and one IaC tool (Terraform).",
                 "2) Build 2-3 portfolio projects with deployed demos (GitHub + live demo).",
@@ -356,7 +489,8 @@ def main_menu():
                 "6) Network: join local meetups, open-source, and mentorship channels."
             ]
             for t in tips:
-                print(wrap(t, indent=4))
+                buf.append(wrap(t, indent=4))
+            print_lines(buf)
         elif choice == "0":
             print("Good luck — keep building! 👋")
             break